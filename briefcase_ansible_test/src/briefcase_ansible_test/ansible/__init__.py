@@ -18,18 +18,10 @@ try:
     multiprocessing.patch_system_modules()  # type: ignore[attr-defined]
 
     # iOS-specific setup - only run when ios_multiprocessing is available
-    from briefcase_ansible_test.utils import (
-        patch_getpass,
-        setup_pwd_module_mock,
-        setup_grp_module_mock,
-        setup_subprocess_mock,
-    )
+    from briefcase_ansible_test.utils import apply_ios_patches
 
     # Apply iOS-specific patches
-    patch_getpass()
-    setup_pwd_module_mock()
-    setup_grp_module_mock()
-    setup_subprocess_mock()
+    apply_ios_patches()
 
     print("iOS_DEBUG: Applied iOS-specific patches")
 
@@ -41,7 +33,6 @@ except ImportError:
 # Import SSH utilities for Paramiko patching - needed on all platforms
 from briefcase_ansible_test.ssh_utils import patch_paramiko_for_async
 
-
 # Apply patch for Paramiko's async keyword issue - needed before Ansible imports
 patch_paramiko_for_async()
 
@@ -19,15 +19,16 @@ def debug_inventory_contents(inventory, target_host, output_callback):
     """
     # Debug inventory contents
     all_hosts = inventory.get_hosts()
-    output_callback(f"Found {len(all_hosts)} total hosts in inventory\n")
-    for host in all_hosts:
-        output_callback(f"  Host: {host.name}\n")
+    lines = [f"Found {len(all_hosts)} total hosts in inventory\n"]
+    lines.extend(f"  Host: {host.name}\n" for host in all_hosts)
 
     # Check if target host pattern matches any hosts
     target_hosts = inventory.get_hosts(pattern=target_host)
-    output_callback(f"Hosts matching '{target_host}': {len(target_hosts)}\n")
-    for host in target_hosts:
-        output_callback(f"  Matched host: {host.name}\n")
+    lines.append(f"Hosts matching '{target_host}': {len(target_hosts)}\n")
+    lines.extend(f"  Matched host: {host.name}\n" for host in target_hosts)
+
+    # One callback for the whole report rather than one per host
+    output_callback("".join(lines))
 
     return target_hosts
 
@@ -41,6 +42,8 @@ def debug_inventory_groups(inventory, output_callback):
         output_callback: Function to call with output messages
     """
     groups = inventory.get_groups_dict()
-    output_callback(f"Inventory groups: {list(groups.keys())}\n")
-    for group_name, hosts in groups.items():
-        output_callback(f"  Group '{group_name}': {hosts}\n")
+    lines = [f"Inventory groups: {list(groups.keys())}\n"]
+    lines.extend(
+        f"  Group '{group_name}': {hosts}\n" for group_name, hosts in groups.items()
+    )
+    output_callback("".join(lines))
@@ -5,10 +5,15 @@ This module provides functions to set up Ansible for iOS compatibility,
 including directory access checks and temporary directory configuration.
 """
 
+import importlib
 import os
+import sys
 import tempfile
 import ansible.constants
 
+# Modules probed by check_multiprocessing_availability
+MULTIPROCESSING_MODULES = ("multiprocessing", "multiprocessing.synchronize")
+
 
 def check_multiprocessing_availability(output_callback):
     """
@@ -18,15 +23,12 @@ def check_multiprocessing_availability(output_callback):
         output_callback: Function to call with output messages
     """
     output_callback("Checking multiprocessing availability...\n")
-    multiprocessing_modules = [
-        "multiprocessing",
-        "multiprocessing.synchronize",
-    ]
-    for module_name in multiprocessing_modules:
+    for module_name in MULTIPROCESSING_MODULES:
         try:
-            import importlib
-
-            module = importlib.import_module(module_name)
+            # Already-imported modules skip the import machinery entirely
+            module = sys.modules.get(module_name) or importlib.import_module(
+                module_name
+            )
             output_callback(f"✅ {module_name} is available\n")
             if module_name == "multiprocessing":
                 output_callback(
@@ -7,6 +7,8 @@ This module provides functions to create and execute Ansible plays.
 import os
 import threading
 import traceback
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from ansible.playbook.play import Play
 
 
@@ -30,21 +32,22 @@ def load_play(play_source, variable_manager, loader, output_callback):
         )
         output_callback("✅ Play loaded successfully\n")
 
-        # Debug play details
-        output_callback(f"Play hosts: {play.hosts}\n")
+        # Debug play details, collected and sent as a single callback
         tasks = getattr(play, "tasks", [])
         if not isinstance(tasks, list):
             tasks = []
-        output_callback(f"Play tasks: {len(tasks)}\n")
+        lines = [f"Play hosts: {play.hosts}\n", f"Play tasks: {len(tasks)}\n"]
         for i, task_block in enumerate(tasks):
-            output_callback(f"  Block {i}: {task_block}\n")
+            lines.append(f"  Block {i}: {task_block}\n")
             if hasattr(task_block, "block"):
                 for j, task in enumerate(task_block.block):
-                    output_callback(f"    Task {j}: {task.name} - {task.action}\n")
+                    lines.append(f"    Task {j}: {task.name} - {task.action}\n")
+        output_callback("".join(lines))
         return play
     except Exception as e:
-        output_callback(f"❌ Play load failed: {e}\n")
-        output_callback(f"Traceback: {traceback.format_exc()}\n")
+        output_callback(
+            f"❌ Play load failed: {e}\nTraceback: {traceback.format_exc()}\n"
+        )
         return None
 
 
@@ -72,11 +75,7 @@ def execute_play_with_timeout(tqm, play, output_callback, timeout=10):
     print(f"iOS_DEBUG: Current thread count: {threading.active_count()}")
     print(f"iOS_DEBUG: Threading module: {threading}")
 
-    result = None
-    exception = None
-
     def run_with_timeout():
-        nonlocal result, exception
         try:
             print("iOS_DEBUG: Inside timeout thread, about to call tqm.run()")
             print(f"iOS_DEBUG: Play object: {play}")
@@ -93,21 +92,23 @@ def execute_play_with_timeout(tqm, play, output_callback, timeout=10):
 
             result = tqm.run(play)
             print(f"iOS_DEBUG: tqm.run() completed with result: {result}")
+            return result
         except Exception as e:
             print(f"iOS_DEBUG: tqm.run() exception: {e}")
-            exception = e
-
-    timeout_thread = threading.Thread(target=run_with_timeout)
-    timeout_thread.start()
-    timeout_thread.join(timeout=timeout)
+            raise
 
-    if timeout_thread.is_alive():
+    # Not used as a context manager: exiting the with block would wait for a
+    # hung tqm.run() and defeat the timeout
+    executor = ThreadPoolExecutor(max_workers=1)
+    try:
+        result = executor.submit(run_with_timeout).result(timeout=timeout)
+    except FutureTimeoutError:
         if output_callback:
             output_callback(f"⚠️ TQM.run() timed out after {timeout} seconds\n")
         return 1
-    elif exception:
-        raise exception
-    else:
-        if output_callback:
-            output_callback(f"Playbook completed with result: {result}\n")
-        return result or 0
+    finally:
+        executor.shutdown(wait=False)
+
+    if output_callback:
+        output_callback(f"Playbook completed with result: {result}\n")
+    return result or 0
@@ -162,8 +162,9 @@ def run_ansible_playbook(app, widget):
                     tqm.cleanup()
 
         except Exception as error:
-            app.ui_updater.add_text_to_output(f"Error: {str(error)}\n")
-            app.ui_updater.add_text_to_output(f"Traceback:\n{traceback.format_exc()}")
+            app.ui_updater.add_text_to_output(
+                f"Error: {str(error)}\nTraceback:\n{traceback.format_exc()}"
+            )
             app.ui_updater.update_status("Error")
 
     # Run the task in a background thread
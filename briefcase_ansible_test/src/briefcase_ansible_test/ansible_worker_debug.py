@@ -2,6 +2,8 @@
 Debug helper to patch WorkerProcess for better error visibility
 """
 
+import traceback
+
 
 def patch_worker_process_for_debugging():
     """Patch WorkerProcess to add debugging before it exits"""
@@ -37,8 +39,6 @@ def patch_worker_process_for_debugging():
 
             except Exception as e:
                 print("iOS_DEBUG: WorkerProcess.__init__ failed: " + str(e))
-                import traceback
-
                 print("iOS_DEBUG: Init traceback:\n" + traceback.format_exc())
                 raise
 
@@ -79,8 +79,6 @@ def patch_worker_process_for_debugging():
             except Exception as e:
                 print("iOS_DEBUG: WorkerProcess._run() exception: " + str(e))
                 print("iOS_DEBUG: Exception type: " + str(type(e)))
-                import traceback
-
                 print(f"iOS_DEBUG: Run traceback:\n{traceback.format_exc()}")
                 raise
 
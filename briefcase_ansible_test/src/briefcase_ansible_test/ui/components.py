@@ -1,14 +1,30 @@
 """
 UI components for briefcase_ansible_test
+
+toga is imported inside the UIComponents factories, so code that only needs
+UIUpdater or BackgroundTaskRunner doesn't load the widget toolkit.
 """
 
-import toga
-from toga.style import Pack
-import asyncio
 import threading
 import logging
+import traceback
+from collections import deque
 from briefcase_ansible_test.utils.data_processing import categorize_log_level
 
+# Seconds to wait before writing queued background output, so a burst of
+# lines lands in the output view as one write (about one frame)
+OUTPUT_FLUSH_INTERVAL = 0.016
+
+# Shared by every UIUpdater that isn't given its own logger
+_DEFAULT_LOGGER = logging.getLogger("UIUpdater")
+
+# Logging levels for the names returned by categorize_log_level
+_LOG_LEVELS = {
+    "ERROR": logging.ERROR,
+    "WARNING": logging.WARNING,
+    "INFO": logging.INFO,
+}
+
 
 class StatusReporter:
     """Standardized status reporting for consistent user feedback."""
@@ -94,6 +110,9 @@ class UIComponents:
     @staticmethod
     def create_output_area():
         """Create and return the output text area and status label."""
+        import toga
+        from toga.style import Pack
+
         # Output text area for displaying results
         output_view = toga.MultilineTextInput(
             readonly=True, style=Pack(flex=1, margin=5)
@@ -122,6 +141,9 @@ class UIComponents:
         if not button_configs:
             raise ValueError("Button configurations must be provided")
 
+        import toga
+        from toga.style import Pack
+
         # Create buttons from configuration tuples
         return [
             toga.Button(label, on_press=callback, style=Pack(margin=5))
@@ -131,6 +153,9 @@ class UIComponents:
     @staticmethod
     def create_main_layout(title, action_buttons, output_view, status_label):
         """Create and return the main layout with all UI components."""
+        import toga
+        from toga.style import Pack
+
         # Main box with vertical layout
         main_box = toga.Box(style=Pack(direction="column", margin=10))
 
@@ -160,70 +185,81 @@ class UIUpdater:
         self.output_view = output_view
         self.status_label = status_label
         self.main_event_loop = main_event_loop
-        self.logger = logger or logging.getLogger("UIUpdater")
+        self.logger = logger or _DEFAULT_LOGGER
+        # Output queued for the next flush; appending to the view rewrites its
+        # whole value, so background lines are coalesced into one write
+        self._pending_output = deque()
+        self._pending_lock = threading.Lock()
+        self._flush_scheduled = False
+        # Ident of the thread that owns the widgets, compared on every update
+        self._main_ident = threading.main_thread().ident
 
     def add_text_to_output(self, text):
         """Add text to the output view from any thread and automatically log it."""
-        # Automatically log all output text
-        # Use pure function to determine log level
-        text_clean = text.strip()
-        log_level = categorize_log_level(text)
-
-        if log_level == "ERROR":
-            self.logger.error(f"UI OUTPUT: {text_clean}")
-        elif log_level == "WARNING":
-            self.logger.warning(f"UI OUTPUT: {text_clean}")
-        else:
-            self.logger.info(f"UI OUTPUT: {text_clean}")
-
-        def update_ui():
-            self.output_view.value += text
+        # Automatically log all output text, skipping the categorisation and
+        # formatting entirely when the logger would discard the record
+        if self.logger.isEnabledFor(logging.ERROR):
+            # Use pure function to determine log level
+            log_level = _LOG_LEVELS[categorize_log_level(text)]
+            if self.logger.isEnabledFor(log_level):
+                self.logger.log(log_level, "UI OUTPUT: %s", text.strip())
+
+        with self._pending_lock:
+            self._pending_output.append(text)
+            schedule_flush = not self._flush_scheduled
+            self._flush_scheduled = True
 
         # If we're on the main thread, update directly
-        if threading.current_thread() is threading.main_thread():
-            update_ui()
-        else:
-            # Create a direct coroutine for updating the text
-            async def update_text():
-                self.output_view.value += text
-
-            # Schedule it on the main event loop
-            asyncio.run_coroutine_threadsafe(update_text(), self.main_event_loop)
+        if threading.get_ident() == self._main_ident:
+            self._flush_output()
+        elif schedule_flush:
+            # Schedule one delayed flush on the main event loop for the burst;
+            # call_later itself isn't thread-safe, so hand it to the loop
+            self.main_event_loop.call_soon_threadsafe(
+                self.main_event_loop.call_later,
+                OUTPUT_FLUSH_INTERVAL,
+                self._flush_output,
+            )
+
+    def _flush_output(self):
+        """Append all queued output to the output view. Main thread only."""
+        with self._pending_lock:
+            chunk = "".join(self._pending_output)
+            self._pending_output.clear()
+            self._flush_scheduled = False
+
+        if chunk:
+            self.output_view.value += chunk
 
     def update_status(self, text):
         """Update the status label from any thread and log status changes."""
-        self.logger.info(f"STATUS: {text}")
+        self.logger.info("STATUS: %s", text)
 
         def update_ui():
             self.status_label.text = text
 
         # If we're on the main thread, update directly
-        if threading.current_thread() is threading.main_thread():
+        if threading.get_ident() == self._main_ident:
             update_ui()
         else:
-            # Create a direct coroutine for updating the status
-            async def update_status_text():
-                self.status_label.text = text
-
-            # Schedule it on the main event loop
-            asyncio.run_coroutine_threadsafe(update_status_text(), self.main_event_loop)
+            # Schedule the plain callback on the main event loop
+            self.main_event_loop.call_soon_threadsafe(update_ui)
 
     def clear_output(self):
         """Clear the output area."""
+        # Drop queued output so it can't reappear after the clear
+        with self._pending_lock:
+            self._pending_output.clear()
 
         def update_ui():
             self.output_view.value = ""
 
         # If we're on the main thread, update directly
-        if threading.current_thread() is threading.main_thread():
+        if threading.get_ident() == self._main_ident:
             update_ui()
         else:
-            # Create a direct coroutine for clearing
-            async def clear_text():
-                self.output_view.value = ""
-
-            # Schedule it on the main event loop
-            asyncio.run_coroutine_threadsafe(clear_text(), self.main_event_loop)
+            # Schedule the plain callback on the main event loop
+            self.main_event_loop.call_soon_threadsafe(update_ui)
 
 
 class BackgroundTaskRunner:
@@ -232,7 +268,7 @@ class BackgroundTaskRunner:
     def __init__(self, ui_updater):
         """Initialize with a UI updater for communicating results."""
         self.ui_updater = ui_updater
-        self.background_tasks = set()  # Keep references to prevent garbage collection
+        self.background_tasks = set()  # Threads of tasks still running
 
     def run_task(self, task_func, initial_status="Working..."):
         """
@@ -242,8 +278,6 @@ class BackgroundTaskRunner:
             task_func: The function to execute in the background
             initial_status: The status message to display while task is running
         """
-        import traceback
-
         # Clear output and update status
         self.ui_updater.clear_output()
         self.ui_updater.update_status(initial_status)
@@ -260,14 +294,19 @@ class BackgroundTaskRunner:
                 error_message = str(error)
                 traceback_str = traceback.format_exc()
 
-                self.ui_updater.add_text_to_output(f"Error: {error_message}\n")
-                self.ui_updater.add_text_to_output(f"Traceback:\n{traceback_str}\n")
+                self.ui_updater.add_text_to_output(
+                    f"Error: {error_message}\nTraceback:\n{traceback_str}\n"
+                )
                 self.ui_updater.update_status("Error")
+            finally:
+                # Drop the reference once finished so the set doesn't grow
+                self.background_tasks.discard(thread)
 
-        # Start background thread
+        # Daemon thread, so quitting the app doesn't wait for a running task
         thread = threading.Thread(target=background_wrapper)
         thread.daemon = True
-        thread.start()
 
-        # Store the thread to prevent garbage collection
+        # Store the thread before starting it, so a task that finishes
+        # immediately still removes itself
         self.background_tasks.add(thread)
+        thread.start()
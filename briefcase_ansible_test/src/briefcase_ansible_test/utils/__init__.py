@@ -20,6 +20,7 @@ from .mocks import (
 
 # iOS-specific patches
 from .ios_patches import (
+    apply_ios_patches,
     patch_getpass,
     setup_multiprocessing_mock,
 )
@@ -35,6 +36,7 @@ __all__ = [
     "MockPopen",
     "setup_subprocess_mock",
     # iOS patches
+    "apply_ios_patches",
     "patch_getpass",
     "setup_multiprocessing_mock",
 ]
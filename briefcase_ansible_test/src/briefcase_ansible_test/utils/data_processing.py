@@ -9,6 +9,11 @@ from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
 import os
 
+# Case-sensitive error markers and lowercase warning markers for
+# categorize_log_level
+_ERROR_INDICATORS = ("✗", "Error:", "failed:", "Exception")
+_WARNING_INDICATORS = ("⚠", "warning")
+
 
 @dataclass(frozen=True)
 class ButtonConfig:
@@ -182,26 +187,25 @@ def parse_public_key_string(public_key_content: str) -> Dict[str, Any]:
 
 def categorize_log_level(text: str) -> str:
     """Determine appropriate log level based on text content."""
-    text_clean = text.strip()
+    # Runs for every line written to the output view: substring checks don't
+    # need the text stripped, and it is lowercased at most once
 
     # Error indicators
-    if any(
-        indicator in text_clean for indicator in ["✗", "Error:", "failed:", "Exception"]
-    ):
-        return "ERROR"
+    for indicator in _ERROR_INDICATORS:
+        if indicator in text:
+            return "ERROR"
+
+    lowered = text.lower()
 
     # Warning indicators
-    if any(indicator in text_clean.lower() for indicator in ["⚠", "warning"]):
-        return "WARNING"
+    for indicator in _WARNING_INDICATORS:
+        if indicator in lowered:
+            return "WARNING"
 
     # Traceback
-    if "traceback" in text_clean.lower():
+    if "traceback" in lowered:
         return "ERROR"
 
-    # Success indicators
-    if text_clean.startswith("✓"):
-        return "INFO"
-
     return "INFO"
 
 
@@ -7,8 +7,12 @@ standard Python libraries work on iOS.
 
 import getpass
 
+from .mocks import setup_grp_module_mock, setup_pwd_module_mock, setup_subprocess_mock
 from .system_utils import simple_getuser
 
+# Set once apply_ios_patches has run, so the patches are applied once
+_IOS_PATCHES_APPLIED = False
+
 
 def patch_getpass():
     """
@@ -29,3 +33,21 @@ def setup_multiprocessing_mock():
     import ios_multiprocessing
 
     ios_multiprocessing.patch_system_modules()
+
+
+def apply_ios_patches():
+    """
+    Apply the getpass patch and the pwd, grp and subprocess mocks.
+
+    Safe to call more than once; the patches are only applied on the first
+    call, so already-patched sys.modules entries are never re-wrapped.
+    """
+    global _IOS_PATCHES_APPLIED
+    if _IOS_PATCHES_APPLIED:
+        return
+
+    patch_getpass()
+    setup_pwd_module_mock()
+    setup_grp_module_mock()
+    setup_subprocess_mock()
+    _IOS_PATCHES_APPLIED = True
@@ -8,6 +8,7 @@ within the Python interpreter, avoiding the need for subprocess creation.
 import sys
 import os
 import json
+import traceback
 from io import StringIO
 
 
@@ -98,8 +99,6 @@ def execute_ansible_module(module_path):
                 f"iOS_DEBUG: Exception during module simulation: {exec_e}\n"
             )
             old_stdout.write(f"iOS_DEBUG: Exception type: {type(exec_e)}\n")
-            import traceback
-
             old_stdout.write(f"iOS_DEBUG: Traceback: {traceback.format_exc()}\n")
             old_stdout.flush()
             # Re-raise to be caught by outer try-catch